@@ -0,0 +1,97 @@
+"""
+Benchmark of backend API throughput: a new aiohttp session per request
+(the previous behaviour of api_request_with_retry) versus the shared,
+pooled ApiClient.
+
+Starts a local stub API on 127.0.0.1 and reports requests/sec for both.
+
+Usage:
+    python benchmarks/bench_api_client.py [--requests 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("API_TOKEN", "42:BENCHMARK")
+
+import aiohttp
+from aiohttp import web
+
+from handlers.aio_client import ApiClient
+
+
+async def stub_expense(request: web.Request) -> web.Response:
+    return web.json_response({"status": "success"})
+
+
+async def start_stub_api() -> tuple:
+    app = web.Application()
+    app.router.add_route("*", "/api/expense/", stub_expense)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/api/"
+
+
+async def session_per_request(base_url: str) -> dict:
+    async with aiohttp.ClientSession() as session:
+        async with session.request(
+            "POST", f"{base_url}expense/", json={"amount": 1, "description": "x"}
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def run(label: str, call, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {total / elapsed:>10.1f} req/s  ({elapsed:.2f}s)")
+
+
+async def main(total: int, concurrency: int) -> None:
+    runner, base_url = await start_stub_api()
+    try:
+        await run(
+            "session per request",
+            lambda: session_per_request(base_url),
+            total,
+            concurrency,
+        )
+
+        client = ApiClient(base_url=base_url)
+        await client.start()
+        try:
+            await run(
+                "pooled ApiClient",
+                lambda: client.request(
+                    "POST", "expense/", json={"amount": 1, "description": "x"}
+                ),
+                total,
+                concurrency,
+            )
+        finally:
+            await client.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
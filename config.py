@@ -62,6 +62,12 @@ API_ENDPOINT_EXPENSE = "expense/"
 API_ENDPOINT_INCOME = "income/"
 MAX_AMOUNT = 10000000
 
+# Connection pool of the shared backend API client (see handlers/aio_client.py)
+API_POOL_LIMIT = int(os.getenv("API_POOL_LIMIT", 100))
+API_POOL_LIMIT_PER_HOST = int(os.getenv("API_POOL_LIMIT_PER_HOST", 20))
+API_KEEPALIVE_TIMEOUT = float(os.getenv("API_KEEPALIVE_TIMEOUT", 30))
+API_DNS_CACHE_TTL = int(os.getenv("API_DNS_CACHE_TTL", 300))
+
 
 class Expense(StatesGroup):
     waiting_for_expense_details = State()
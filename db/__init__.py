@@ -1 +1 @@
-from .models import User, Finance, db_session
\ No newline at end of file
+from .models import User, Finance, db_session, async_session, async_engine
\ No newline at end of file
@@ -1 +1 @@
-from .db import User, Finance, session as db_session
\ No newline at end of file
+from .db import User, Finance, session as db_session, async_session, async_engine
\ No newline at end of file
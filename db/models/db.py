@@ -1,4 +1,7 @@
+import os
 from sqlalchemy import create_engine, Column, Integer, String, Float, ForeignKey
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 
@@ -56,8 +59,21 @@ class Finance(BaseModel):
     user = relationship("User", back_populates="finances")
 
 
-engine = create_engine("sqlite:///finance.db")
+DATABASE_PATH = os.getenv("DATABASE_PATH", "finance.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+
+engine = create_engine(f"sqlite:///{DATABASE_PATH}")
 Base.metadata.create_all(engine)
 
 Session = sessionmaker(bind=engine)
 session = Session()
+
+# Non-blocking engine for code running on the event loop: aiosqlite runs the
+# sqlite calls in its own thread, so handlers don't stall while waiting on disk.
+async_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DATABASE_PATH}",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_POOL_SIZE,
+)
+async_session = async_sessionmaker(async_engine, expire_on_commit=False)
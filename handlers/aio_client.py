@@ -6,7 +6,13 @@ import aiohttp
 import logging
 import asyncio
 from typing import Dict, Any, Optional
-from config import API_BASE_URL
+from config import (
+    API_BASE_URL,
+    API_POOL_LIMIT,
+    API_POOL_LIMIT_PER_HOST,
+    API_KEEPALIVE_TIMEOUT,
+    API_DNS_CACHE_TTL,
+)
 from keyboards import (
     get_start_keyboard,
     get_back_to_start_keyboard,
@@ -15,6 +21,90 @@ from keyboards import (
 logging.basicConfig(level=logging.INFO)
 
 
+class ApiClient:
+    """
+    Long-lived HTTP client for the backend API.
+
+    Owns a single aiohttp.ClientSession whose connector keeps idle connections
+    alive, so consecutive requests reuse the TCP/TLS connection instead of
+    opening a new one per call.
+
+    Attributes:
+        base_url (str): Base URL of the backend API.
+        limit (int): Total number of simultaneous connections in the pool.
+        limit_per_host (int): Maximum simultaneous connections to one host.
+        keepalive_timeout (float): Seconds an idle connection stays open.
+        dns_cache_ttl (int): Seconds resolved host addresses are cached.
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        limit: int = API_POOL_LIMIT,
+        limit_per_host: int = API_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = API_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = API_DNS_CACHE_TTL,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """
+        Opens the underlying session. Safe to call more than once.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self) -> None:
+        """
+        Closes the underlying session and all pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Makes a single HTTP request to the API over the pooled session.
+
+        The session is opened lazily if start() has not been called yet.
+
+        Returns:
+            dict: JSON response from the API.
+
+        Raises:
+            aiohttp.ClientError: For HTTP errors or connection issues.
+        """
+        await self.start()
+        url = f"{self.base_url}/{endpoint}"
+        async with self._session.request(
+            method, url, params=params, json=json, headers=headers
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+api_client = ApiClient()
+
+
 async def api_request_with_retry(
     method: str,
     endpoint: str,
@@ -22,6 +112,7 @@ async def api_request_with_retry(
     json: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
     retries: int = 3,
+    client: Optional[ApiClient] = None,
 ) -> Dict[str, Any]:
     """
     Makes an HTTP request to the API with retry mechanism.
@@ -33,6 +124,7 @@ async def api_request_with_retry(
         json (dict, optional): Data to send in the request body.
         headers (dict, optional): Additional headers for the request.
         retries (int): Number of retry attempts for transient errors.
+        client (ApiClient, optional): Client to use, defaults to the shared one.
 
     Returns:
         dict: JSON response from the API.
@@ -40,15 +132,12 @@ async def api_request_with_retry(
     Raises:
         Exception: Raises an exception for HTTP errors or connection issues.
     """
-    url = f"{API_BASE_URL}/{endpoint}"
+    client = client or api_client
     for attempt in range(retries):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method, url, params=params, json=json, headers=headers
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            return await client.request(
+                method, endpoint, params=params, json=json, headers=headers
+            )
         except aiohttp.ClientError as e:
             logging.error(f"Network error on attempt {attempt + 1}: {str(e)}")
             if attempt == retries - 1:
@@ -58,24 +147,24 @@ async def api_request_with_retry(
 
 async def handle_api_request(
     method: str,
-    params: Dict[str, Any],
     endpoint: str,
     payload: Optional[Dict[str, Any]],
     success_message: str,
     error_message: str,
     msg: Any,
+    params: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Handles API requests and sends messages based on the response.
 
     Args:
         method (str): HTTP method to use (e.g., "POST", "GET").
-        params (dict): Parameters for the API request.
         endpoint (str): API endpoint to interact with.
         payload (dict, optional): Data to send in the request body.
         success_message (str): Message to send on a successful response.
         error_message (str): Message to send on an error response.
         msg (Any): Message object to respond to the user.
+        params (dict, optional): Parameters for the API request.
     """
     try:
         response = await api_request_with_retry(
@@ -104,12 +193,12 @@ async def generate_csv_report(chat_id: str, msg: Any) -> None:
     params = {"chat_id": chat_id}
     await handle_api_request(
         "GET",
-        params,
         "generate_csv_report",
         None,
         "CSV report generated successfully.",
         "Failed to generate CSV report.",
         msg,
+        params=params,
     )
 
 
@@ -124,10 +213,10 @@ async def generate_excel_report(chat_id: str, msg: Any) -> None:
     params = {"chat_id": chat_id}
     await handle_api_request(
         "GET",
-        params,
         "generate_excel_report",
         None,
         "Excel report generated successfully.",
         "Failed to generate Excel report.",
         msg,
+        params=params,
     )
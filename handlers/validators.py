@@ -3,7 +3,7 @@ This module contains validation functions for the finance tracker bot.
 """
 
 from sqlalchemy.sql import text
-from db import db_session
+from db import async_session
 
 
 async def validate_amount_description(text: str):
@@ -38,8 +38,8 @@ async def validate_user_exists(username: str):
     Returns:
         bool: True if the user exists, False otherwise.
     """
-    with db_session as session:
-        result =  session.execute(
+    async with async_session() as session:
+        result = await session.execute(
             text("SELECT * FROM users WHERE username = :username"),
             {"username": username},
         )
@@ -56,8 +56,8 @@ async def validate_expense_id(expense_id: str):
     Returns:
         bool: True if the expense ID exists, False otherwise.
     """
-    with db_session as session:
-        result =  session.execute(
+    async with async_session() as session:
+        result = await session.execute(
             text("SELECT * FROM expenses WHERE id = :id"), {"id": expense_id}
         )
         return result.scalar() is not None
@@ -73,8 +73,8 @@ async def validate_income_id(income_id: str):
     Returns:
         bool: True if the income ID exists, False otherwise.
     """
-    with db_session as session:
-        result =  session.execute(
+    async with async_session() as session:
+        result = await session.execute(
             text("SELECT * FROM incomes WHERE id = :id"), {"id": income_id}
         )
         return result.scalar() is not None
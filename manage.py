@@ -1,5 +1,6 @@
 import logging, asyncio, sys, handlers
 from config import dp, bot
+from handlers.aio_client import api_client
 
 
 @dp.startup()
@@ -7,6 +8,7 @@ async def on_startup(dispatcher):
     """
     Called on bot startup. Initializes necessary components and logs the startup.
     """
+    await api_client.start()
     logging.info("Bot has started")
 
 
@@ -15,6 +17,7 @@ async def on_shutdown(dispatcher):
     """
     Called on bot shutdown. Cleans up resources and logs the shutdown.
     """
+    await api_client.close()
     logging.info("Bot has stopped")
 
 
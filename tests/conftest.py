@@ -0,0 +1,11 @@
+import os
+import tempfile
+import sys
+from pathlib import Path
+
+# The bot modules import each other as top-level packages (config, db, handlers, ...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("API_TOKEN", "42:TEST")
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(prefix="finance-tests-"), "test.db")
+)
@@ -0,0 +1,47 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from handlers.aio_client import ApiClient, api_request_with_retry
+
+
+@pytest_asyncio.fixture
+async def stub_api():
+    connections = set()
+
+    async def expense(request):
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_route("*", "/api/expense/", expense)
+    server = TestServer(app)
+    await server.start_server()
+    server.connections = connections
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_api_client_reuses_connection(stub_api):
+    client = ApiClient(base_url=str(stub_api.make_url("/api/")))
+    try:
+        for _ in range(5):
+            response = await api_request_with_retry("GET", "expense/", client=client)
+            assert response == {"status": "success"}
+    finally:
+        await client.close()
+
+    assert len(stub_api.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_api_client_close_and_restart(stub_api):
+    client = ApiClient(base_url=str(stub_api.make_url("/api/")))
+    await client.start()
+    await client.close()
+
+    response = await client.request("POST", "expense/", json={"amount": 1})
+    assert response == {"status": "success"}
+    await client.close()
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import text
+
+from db import db_session
+from handlers.validators import (
+    validate_amount_description,
+    validate_user_exists,
+    validate_expense_id,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed_db():
+    db_session.execute(
+        text("CREATE TABLE IF NOT EXISTS expenses (id INTEGER PRIMARY KEY, user_id INTEGER)")
+    )
+    db_session.execute(
+        text("INSERT OR IGNORE INTO users (id, username, email) VALUES (1, 'alice', 'a@x')")
+    )
+    db_session.execute(text("INSERT OR IGNORE INTO expenses (id, user_id) VALUES (7, 1)"))
+    db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_validate_amount_description():
+    assert await validate_amount_description("100 Lunch") == (100.0, "Lunch")
+    amount, error = await validate_amount_description("abc Lunch")
+    assert amount is None and "numeric" in error
+
+
+@pytest.mark.asyncio
+async def test_validate_user_exists():
+    assert await validate_user_exists("alice") is True
+    assert await validate_user_exists("bob") is False
+
+
+@pytest.mark.asyncio
+async def test_validate_expense_id():
+    assert await validate_expense_id("7") is True
+    assert await validate_expense_id("8") is False